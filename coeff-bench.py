@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+from timeit import timeit
+
+from libs.translate import interpret
+from libs.functions import Derivative, set_coefficient_backend
+
+
+# Integer coefficients, so every backend can parse the expression
+INT_EXPRESSION = ["3*x^5*y^3 + 2*x^2*y^1 + 7*y^4", "x^2 + 5*y^3/x^3*y^1 + 2*x^1 + 4"]
+# Non-integer coefficients which cancel, 0.1 + 0.2 - 0.3 is not a zero in floats
+CANCEL_EXPRESSION = [
+	"0.1*x^2*y^1 + 0.2*x^2*y^1 + -0.3*x^2*y^1 + 1.5*x^3/0.1*x^1*y^2 + 0.2*x^1*y^2 + -0.3*x^1*y^2 + 2.5*y^2",
+	"0.7*x^4 + 0.1*y^3 + 0.2*y^3 + -0.3*y^3/x^1 + 0.1*x^1 + 0.2*x^1 + -0.3*x^1",
+]
+# (backend, float tolerance) pairs
+BACKENDS = {
+	"int": [("int", None), ("fraction", None), ("float", None)],
+	"cancel": [("fraction", None), ("float", None), ("float", 1e-12)],
+}
+ARGS = {"x": 1.5, "y": 0.5}
+REPEATS = 200
+
+
+def count_terms(math_expr) -> int:
+	""" Returns number of monomials in all dividends and divisors of a MathExpression"""
+	return sum([len(func_expr.dividend.monomials) + len(func_expr.divisor.monomials)
+		for func_expr in math_expr.expression])
+
+
+def bench(expression: list[str], kind: str, tolerance) -> None:
+	""" Prints time of a differentiation and an evaluation using the backend.
+		Parsing is done once and is not timed.
+
+		:param expression: a list of rational functions in string format;
+		:param kind: a string, one of CoefficientBackend.KINDS;
+		:param tolerance: a float or None, tolerance of the float backend.
+	"""
+	set_coefficient_backend(kind, tolerance)
+	math_expr = interpret(expression)
+	diff_time = timeit(lambda: Derivative("x")._diff(math_expr), number=REPEATS)
+	deriv = Derivative("y")._diff(Derivative("x")._diff(math_expr))
+	value_time = timeit(lambda: deriv.value(ARGS), number=REPEATS)
+	name = kind if tolerance is None else f"{kind}({tolerance})"
+	print(f"{name:>14}: differentiate {diff_time/REPEATS*1e3:.3f} ms, "
+		f"value {value_time/REPEATS*1e3:.3f} ms, "
+		f"terms of d2/dxdy {count_terms(deriv)}")
+
+
+def main():
+	print("Integer coefficients:")
+	for kind, tolerance in BACKENDS["int"]:
+		bench(INT_EXPRESSION, kind, tolerance)
+	print("Cancelling non-integer coefficients:")
+	for kind, tolerance in BACKENDS["cancel"]:
+		bench(CANCEL_EXPRESSION, kind, tolerance)
+
+
+main()
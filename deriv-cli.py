@@ -1,15 +1,34 @@
 #!/usr/bin/python3
+import sys
+
 from libs.translate import interpret, interpret_reverse
+from libs.functions import CoefficientBackend, set_coefficient_backend
+
+
+USAGE = f"Usage: {sys.argv[0]} [{'|'.join(CoefficientBackend.KINDS)}] [float tolerance]"
 
 
 def main():
+	# optional coefficient backend: int, fraction or float (default)
+	# and tolerance for the float backend
+	try:
+		if len(sys.argv) > 3:
+			raise ValueError("Too many arguments")
+		if len(sys.argv) > 1:
+			tolerance = float(sys.argv[2]) if len(sys.argv) > 2 else None
+			set_coefficient_backend(sys.argv[1], tolerance)
+	except ValueError as error:
+		sys.exit(f"{error}\n{USAGE}")
 	new_expr = []
 	while True:
 		tmp_expr = input("Enter next rational function: ")
 		if tmp_expr == "":
 			break
 		new_expr.append(tmp_expr)
-	math_expr = interpret(new_expr)
+	try:
+		math_expr = interpret(new_expr)
+	except ValueError as error:
+		sys.exit(str(error))
 	diff_var = input("Enter a variable of differentiation: ")
 	math_expr.differentiate(diff_var)
 	print("Derivative is: ", interpret_reverse(math_expr))
@@ -1,13 +1,124 @@
 from copy import deepcopy
 from typing import Union
 from itertools import product
+from fractions import Fraction
+from math import isfinite
+
+
+# A coefficient of a monomial, its type depends on the selected CoefficientBackend
+Coefficient = Union[int, Fraction, float]
+
+
+class CoefficientBackend:
+	""" A number type used for monomials' coefficients
+
+		Attributes:
+			kind: a string, one of CoefficientBackend.KINDS:
+				"int" - Python ints only, accepts integer coefficients only;
+				"fraction" - exact rationals, coefficients with denominator 1
+					are kept as ints;
+				"float" - floats.
+			tolerance: a float or None, is used by the "float" backend only.
+				If it is None, only exact zeros are removed (the old behaviour),
+				otherwise a sum of like terms is treated as a zero, when its
+				abs value is not greater than tolerance * max abs value of the terms.
+	"""
+
+	KINDS = ("int", "fraction", "float")
+
+	def __init__(self, kind: str = "float", tolerance: Union[float, None] = None):
+		""" Initialize self, see CoefficientBackend.select"""
+		self.select(kind, tolerance)
+
+	def select(self, kind: str, tolerance: Union[float, None] = None) -> None:
+		""" Changes the backend in place, so every module which imported
+			the coefficients object sees the new one.
+
+			:param kind: a string, one of CoefficientBackend.KINDS;
+			:param tolerance: a float or None, relative zero threshold for the "float" backend.
+		"""
+		if kind not in CoefficientBackend.KINDS:
+			raise ValueError(f"Unknown coefficient backend: {kind}, use one of {', '.join(CoefficientBackend.KINDS)}")
+		if tolerance is not None:
+			if kind != "float":
+				raise ValueError(f"Tolerance is used by the float backend only, not by the {kind} one")
+			if isinstance(tolerance, bool) or not isinstance(tolerance, (int, float)) \
+					or not isfinite(tolerance) or tolerance < 0:
+				raise ValueError(f"Tolerance should be a finite number >= 0, not {tolerance}")
+		self.kind = kind
+		self.tolerance = tolerance
+
+	def parse(self, const_str: str) -> Coefficient:
+		""" Translates coefficient in string format to a number of the backend's type
+
+			:param const_str: string, presenting a coefficient, e.g. "3", "-2.5", "(3/2)".
+		"""
+		number_str = const_str
+		if number_str.startswith("(") and number_str.endswith(")"):
+			number_str = number_str[1:-1]
+		try:
+			if self.kind == "int":
+				return int(number_str)
+			elif self.kind == "fraction":
+				return self.normalize(Fraction(number_str))
+			elif "/" in number_str:
+				return float(Fraction(number_str))
+			else:
+				return float(number_str)
+		except (ValueError, ZeroDivisionError):
+			raise ValueError(f"Invalid coefficient for the {self.kind} backend: {const_str}") from None
+
+	def format(self, const: Coefficient) -> str:
+		""" Translates coefficient to string format, which CoefficientBackend.parse accepts.
+			Non-integer fractions are parenthesised, so their "/" is not mistaken
+			for a rational function's one, e.g. "(3/2)".
+		"""
+		if isinstance(const, Fraction):
+			return f"({const})"
+		return str(const)
+
+	def normalize(self, const: Coefficient) -> Coefficient:
+		""" Returns an int instead of a Fraction with denominator 1"""
+		if isinstance(const, Fraction) and const.denominator == 1:
+			return const.numerator
+		return const
+
+	def is_zero(self, const: Coefficient, terms: list[Coefficient] = ()) -> bool:
+		""" Returns True, if the coefficient should be treated as a zero
+
+			:param const: a coefficient to check;
+			:param terms: coefficients summed into const, the "float" backend's
+				tolerance is relative to max abs value of them. If it is empty,
+				only an exact zero is a zero.
+		"""
+		if const == 0:
+			return True
+		if self.kind == "float" and self.tolerance is not None and terms:
+			return abs(const) <= self.tolerance * max(abs(term) for term in terms)
+		return False
+
+
+# Backend used for all coefficients, change it with set_coefficient_backend
+coefficients = CoefficientBackend()
+
+
+def set_coefficient_backend(kind: str, tolerance: Union[float, None] = None) -> None:
+	""" Selects a process-wide backend for coefficients. It is used both for parsing
+		and for cleaning up (e.g. differentiating) any expression after the call,
+		including already built ones, so select it before interpreting expressions.
+
+		:param kind: a string, one of CoefficientBackend.KINDS;
+		:param tolerance: a float or None, relative zero threshold for the "float" backend.
+	"""
+	coefficients.select(kind, tolerance)
 
 
 class Monomial:
 	""" A model of a monomial (product of many variables)
 
 		Attributes:
-			const: a integer, coefficient k in k*x^2*y^8*z^3, is a 1 by default.
+			const: a Coefficient, coefficient k in k*x^2*y^8*z^3, is a 1 by default.
+				Its type depends on the selected CoefficientBackend.
 			factors: a dict of strings-integers, factors names(i.e. variables letters in monomial)
 				and their degrees in monomial.
 				E.g.: {"x": degree_x, "y": degree_y, ...}.
@@ -29,7 +140,7 @@ class Monomial:
 			return True
 		return False
 	
-	def __init__(self, factors: dict[str, int], const: float = 1.0):
+	def __init__(self, factors: dict[str, int], const: Coefficient = 1.0):
 		"""	Initialize self, creates variables attr using Monomial._count_variables"""
 		self.factors = factors
 		self.const = const
@@ -62,7 +173,8 @@ class Monomial:
 			deletes those useless factors. Updates the variables at the end.
 		"""
 		old_factors: dict = self.factors
-		if self.const == 0:
+		if coefficients.is_zero(self.const):
+			self.const = Monomial.zero().const
 			self.factors = Monomial.zero().factors
 		else:
 			new_factors = {}
@@ -158,8 +270,9 @@ class Polynomial:
 				monomial_counter[dict_key] = [i]
 		for like_monomials_i in monomial_counter.values():
 			factors = monomial_factors[like_monomials_i[0]]
-			const = sum([old_monomials[i].const for i in like_monomials_i])
-			if const != 0:
+			consts = [old_monomials[i].const for i in like_monomials_i]
+			const = coefficients.normalize(sum(consts))
+			if not coefficients.is_zero(const, consts):
 				new_monomials.append(Monomial(factors, const))
 		# if monomials is empty, i.e. sum of monomials is equal to zero
 		# so even a zero-monomial wasn't included, 
@@ -350,7 +463,7 @@ class Product:
 
 	def __multiply_monomials(self) -> Monomial:
 		"""	Returns a product of two monomials"""
-		const = self.factor1.const * self.factor2.const
+		const = coefficients.normalize(self.factor1.const * self.factor2.const)
 		factors = {}
 		variables = self.factor1.variables | self.factor2.variables
 		for var_i in variables:
@@ -394,7 +507,7 @@ class Derivative:
 		if self.var not in monomial.factors:
 			return Monomial.zero()
 		else:
-			const = monomial.const * monomial.factors[self.var]
+			const = coefficients.normalize(monomial.const * monomial.factors[self.var])
 			factors = deepcopy(monomial.factors)
 			factors[self.var] -= 1
 			deriv_monomial = Monomial(factors, const)
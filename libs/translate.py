@@ -8,11 +8,11 @@ def _str_to_monomial(monomial_str: str) -> Monomial:
 			e.g. "3*x^5*y^3*z^2"
 	"""
 	monomial_ls = [factor_str.split("^") for factor_str in monomial_str.split("*")]
-	const = 1.0
+	const = coefficients.parse("1")
 	factors = {}
 	for elem in monomial_ls:
 		if len(elem) == 1:
-			const = float(elem[0])
+			const = coefficients.parse(elem[0])
 		elif len(elem) == 2:
 			var, degree = elem[0], elem[1]
 			degree = int(degree)
@@ -33,6 +33,48 @@ def _str_to_polynomial(polynomial_str: str) -> Polynomial:
 	return Polynomial(monomials)
 
 
+def _unwrap(expression_str: str) -> str:
+	""" Removes parentheses around the whole expression, if there are,
+		e.g. "(3*x^2 + 1)" -> "3*x^2 + 1", but "(3/2)*x^2" stays the same.
+	"""
+	expression_str = expression_str.strip()
+	if not (expression_str.startswith("(") and expression_str.endswith(")")):
+		return expression_str
+	depth = 0
+	for i, char in enumerate(expression_str):
+		if char == "(":
+			depth += 1
+		elif char == ")":
+			depth -= 1
+			# the first parenthesis is closed before the end
+			if depth == 0 and i != len(expression_str) - 1:
+				return expression_str
+	return expression_str[1:-1]
+
+
+def _split_rational_function(func_expr: str) -> list[str]:
+	""" Splits rational function expression in string format by "/"
+		out of parentheses, i.e. to a dividend and a divisor, so
+		coefficients like "(3/2)" are not split.
+
+		:param func_expr: string, presenting rational function expression
+			e.g. "((3/2)*x^2 + 1)/(y^1)"
+	"""
+	parts = []
+	depth = 0
+	start = 0
+	for i, char in enumerate(func_expr):
+		if char == "(":
+			depth += 1
+		elif char == ")":
+			depth -= 1
+		elif char == "/" and depth == 0:
+			parts.append(func_expr[start:i])
+			start = i + 1
+	parts.append(func_expr[start:])
+	return parts
+
+
 def interpret(expression_str: list[str]) -> MathExpression:
 	""" Translates math expression in string format to MathExpression object
 	
@@ -41,14 +83,17 @@ def interpret(expression_str: list[str]) -> MathExpression:
 	"""
 	math_expr = []
 	for func_expr in expression_str:
-		if "/" in func_expr:
-			dividend, divisor = func_expr.split("/")
+		func_parts = _split_rational_function(func_expr)
+		if len(func_parts) == 2:
+			dividend, divisor = func_parts
 			divisor: str
-			divisor = _str_to_polynomial(divisor)
-		else:
-			dividend = func_expr
+			divisor = _str_to_polynomial(_unwrap(divisor))
+		elif len(func_parts) == 1:
+			dividend = func_parts[0]
 			divisor: Polynomial = Polynomial.one()
-		dividend = _str_to_polynomial(dividend)
+		else:
+			raise ValueError(f"Rational function should contain one \"/\" at most: {func_expr}")
+		dividend = _str_to_polynomial(_unwrap(dividend))
 		math_expr.append(RationalFunction(dividend, divisor))
 	return MathExpression(math_expr)
 
@@ -59,10 +104,10 @@ def _monomial_to_str(monomial: Monomial) -> str:
 		:param monomial: a monomial object, which is going to be used for translation
 	"""
 	if monomial.factors == Monomial.zero().factors:
-		return str(monomial.const)
+		return coefficients.format(monomial.const)
 	else:
 		monomial_ls = []
-		monomial_ls.append(str(monomial.const))
+		monomial_ls.append(coefficients.format(monomial.const))
 		for factor, degree in monomial.factors.items():
 			monomial_ls.append(str(factor) + "^" + str(degree))
 		return "*".join(monomial_ls)
@@ -0,0 +1,113 @@
+import unittest
+from fractions import Fraction
+
+from libs.functions import Monomial, coefficients, set_coefficient_backend
+from libs.translate import interpret, interpret_reverse, _rational_function_to_str
+
+
+class CoefficientBackendTest(unittest.TestCase):
+
+	def tearDown(self):
+		set_coefficient_backend("float")
+
+	def test_fraction_exact_cancellation(self):
+		set_coefficient_backend("fraction")
+		math_expr = interpret(["0.1*x^2 + 0.2*x^2 + -0.3*x^2 + x^3"])
+		self.assertEqual(interpret_reverse(math_expr), "1*x^3")
+		math_expr.differentiate("x")
+		self.assertEqual(interpret_reverse(math_expr), "3*x^2")
+
+	def test_float_keeps_residue_without_tolerance(self):
+		set_coefficient_backend("float")
+		math_expr = interpret(["0.1*x^2 + 0.2*x^2 + -0.3*x^2 + x^3"])
+		self.assertEqual(len(math_expr.expression[0].dividend.monomials), 2)
+
+	def test_float_relative_tolerance(self):
+		set_coefficient_backend("float", 1e-12)
+		math_expr = interpret(["0.1*x^2 + 0.2*x^2 + -0.3*x^2 + x^3"])
+		self.assertEqual(interpret_reverse(math_expr), "1.0*x^3")
+		# small coefficients which don't cancel are kept
+		math_expr = interpret(["0.0000000000001*x^2"])
+		self.assertEqual(math_expr.expression[0].dividend.monomials[0].const, 1e-13)
+
+	def test_float_tolerance_does_not_change_other_terms(self):
+		set_coefficient_backend("float", 1e-12)
+		math_expr = interpret(["0.0000000000001*x^3 + 5"])
+		self.assertEqual(len(math_expr.expression[0].dividend.monomials), 2)
+		self.assertEqual(math_expr.value({"x": 0}), 5.0)
+
+	def test_zero_monomial_loses_const(self):
+		monomial = Monomial({"x": 3}, 0.0)
+		monomial._cleanup()
+		self.assertEqual(monomial.factors, {})
+		self.assertEqual(monomial.const, 0)
+
+	def test_int_parsing(self):
+		set_coefficient_backend("int")
+		monomial = interpret(["3*x^2"]).expression[0].dividend.monomials[0]
+		self.assertIs(type(monomial.const), int)
+		with self.assertRaisesRegex(ValueError, "2.5"):
+			interpret(["2.5*x^2"])
+
+	def test_unknown_backend(self):
+		with self.assertRaises(ValueError):
+			set_coefficient_backend("decimal")
+
+	def test_invalid_tolerance(self):
+		for tolerance in (-1.0, float("nan"), float("inf"), "1e-12"):
+			with self.subTest(tolerance=tolerance):
+				with self.assertRaises(ValueError):
+					set_coefficient_backend("float", tolerance)
+
+	def test_tolerance_for_exact_backend(self):
+		for kind in ("int", "fraction"):
+			with self.subTest(kind=kind):
+				with self.assertRaises(ValueError):
+					set_coefficient_backend(kind, 1e-3)
+
+	def test_zero_denominator(self):
+		for kind in ("fraction", "float"):
+			set_coefficient_backend(kind)
+			with self.subTest(kind=kind):
+				with self.assertRaisesRegex(ValueError, "Invalid coefficient"):
+					interpret(["(1/0)*x^2"])
+
+	def test_unbalanced_parentheses(self):
+		for kind in ("int", "fraction", "float"):
+			set_coefficient_backend(kind)
+			for func_str in ("3)*x^2", "((3*x^2"):
+				with self.subTest(kind=kind, func_str=func_str):
+					with self.assertRaisesRegex(ValueError, "Invalid coefficient"):
+						interpret([func_str])
+
+	def test_fraction_normalization(self):
+		set_coefficient_backend("fraction")
+		self.assertIs(type(coefficients.parse("3")), int)
+		self.assertEqual(coefficients.parse("1.5"), Fraction(3, 2))
+		math_expr = interpret(["1.5*x^2"])
+		math_expr.differentiate("x")
+		const = math_expr.expression[0].dividend.monomials[0].const
+		self.assertIs(type(const), int)
+		self.assertEqual(const, 3)
+
+	def test_round_trip(self):
+		for kind in ("int", "fraction", "float"):
+			set_coefficient_backend(kind)
+			math_expr = interpret(["3*x^2*y^1/2*y^1 + 1", "-x^3 + 5"])
+			if kind != "int":
+				math_expr = interpret(["1.5*x^2/y^1", "0.25*x^3*y^2 + 1"])
+			math_expr.differentiate("y")
+			func_strs = [_rational_function_to_str(func_expr) for func_expr in math_expr.expression]
+			round_trip = interpret(func_strs)
+			with self.subTest(kind=kind):
+				self.assertEqual([_rational_function_to_str(func_expr) for func_expr in round_trip.expression], func_strs)
+
+	def test_fraction_format(self):
+		set_coefficient_backend("fraction")
+		math_expr = interpret(["1.5*x^2/y^1"])
+		func_str = _rational_function_to_str(math_expr.expression[0])
+		self.assertEqual(func_str, "((3/2)*x^2)/(1*y^1)")
+
+
+if __name__ == "__main__":
+	unittest.main()